@@ -7,9 +7,17 @@ The ultimate post-apocalypse system verification tool
 import os
 import sys
 import json
+import argparse
+import hashlib
+import signal
+import importlib.metadata
+import importlib.util
 import subprocess
+import threading
 import time
+from contextlib import redirect_stdout
 from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 # Colors for terminal output
@@ -24,23 +32,224 @@ class Colors:
     BOLD = '\033[1m'
     NC = '\033[0m'  # No Color
 
+# Default per-check time budget in seconds
+CHECK_TIMEOUT = 10.0
+# Budget for --quick, which runs as a container HEALTHCHECK with a 3s timeout
+QUICK_TIMEOUT = 2.0
+# The only statuses that make the scan exit non-zero (and the daemon answer 503)
+FAILURE_STATUSES = ('FAIL', 'TIMEOUT')
+
+# Health reports live here; older ones are compacted into HISTORY_FILE
+REPORT_DIR = '.recovery'
+REPORT_RETENTION = 20
+HISTORY_FILE = 'health_history.jsonl'
+HISTORY_LIMIT = 1000
+
+# Directory listings and file hashes are reused across runs while stat() says nothing changed
+# In its own directory, so rewriting it never changes the mtime of the scanned .recovery/ itself
+SCAN_CACHE_FILE = '.recovery/.cache/scan_cache.json'
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Checks running concurrently buffer their output here so it can be printed in order
+_output = threading.local()
+
+def emit(text=""):
+    buffer = getattr(_output, 'lines', None)
+    if buffer is None:
+        print(text)
+    else:
+        buffer.append(text)
+
 def print_header(text):
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.NC}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{text.center(60)}{Colors.NC}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.NC}\n")
+    emit(f"\n{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.NC}")
+    emit(f"{Colors.BOLD}{Colors.BLUE}{text.center(60)}{Colors.NC}")
+    emit(f"{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.NC}\n")
 
 def print_status(name, status, details=""):
-    icon = "✅" if "OK" in status else "❌" if "FAIL" in status else "⚠️"
-    color = Colors.GREEN if "OK" in status else Colors.RED if "FAIL" in status else Colors.YELLOW
-    print(f"   {icon} {Colors.BOLD}{name}:{Colors.NC} {color}{status}{Colors.NC}")
+    icon = "✅" if "OK" in status else "❌" if "FAIL" in status or "TIMEOUT" in status else "⚠️"
+    color = Colors.GREEN if "OK" in status else Colors.RED if "FAIL" in status or "TIMEOUT" in status else Colors.YELLOW
+    emit(f"   {icon} {Colors.BOLD}{name}:{Colors.NC} {color}{status}{Colors.NC}")
     if details:
-        print(f"      {Colors.CYAN}{details}{Colors.NC}")
+        emit(f"      {Colors.CYAN}{details}{Colors.NC}")
+
+def probe_package(package):
+    """Locate an installed package and its version without importing it"""
+    try:
+        found = importlib.util.find_spec(package) is not None
+    except (ImportError, ValueError):
+        found = False
+    if not found:
+        return {'status': 'MISSING'}
+    try:
+        version = importlib.metadata.version(package)
+    except importlib.metadata.PackageNotFoundError:
+        version = 'unknown'
+    return {'status': 'OK', 'version': version}
+
+def import_package(package):
+    """Actually import a package (deep mode), timing how long the import takes"""
+    started = time.perf_counter()
+    try:
+        module = __import__(package)
+    except ImportError as e:
+        return {'status': 'MISSING', 'error': str(e)}
+    import_ms = round((time.perf_counter() - started) * 1000, 1)
+    return {'status': 'OK', 'version': getattr(module, '__version__', 'unknown'), 'import_ms': import_ms}
+
+def run_command(args, timeout=CHECK_TIMEOUT):
+    """subprocess.run with captured text output and a hard timeout"""
+    return subprocess.run(args, capture_output=True, text=True, timeout=timeout)
+
+def start_command(args):
+    """Start a command without waiting, so several can run while other work happens"""
+    return subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+def finish_command(process, timeout=CHECK_TIMEOUT):
+    """Collect a start_command() process as a CompletedProcess, killing it on timeout"""
+    try:
+        stdout, stderr = process.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.communicate()
+        raise
+    return subprocess.CompletedProcess(process.args, process.returncode, stdout, stderr)
+
+def stop_commands(*processes):
+    """Kill and reap start_command() processes that were never collected, e.g. after an earlier failure"""
+    for process in processes:
+        if process is not None and process.poll() is None:
+            process.kill()
+            process.communicate()
+
+class ScanCache:
+    """Persisted stat-keyed cache of directory scans and file hashes
+    
+    A directory's entries only change when its mtime does, so counts and
+    listings are reused while (mtime_ns, inode) match. File hashes are reused
+    while (size, mtime_ns, inode) match, so unchanged backups are never re-read.
+    """
+    
+    def __init__(self, path=SCAN_CACHE_FILE):
+        self.path = path
+        self.dirs = {}
+        self.hashes = {}
+        self.bytes_hashed = 0
+        self._lock = threading.Lock()
+        self._dirty = False
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            self.dirs = data.get('dirs', {})
+            self.hashes = data.get('hashes', {})
+        except (OSError, ValueError):
+            pass  # First run or unreadable cache: everything is scanned fresh
+    
+    def _scan_dir(self, path, field, scan):
+        st = os.stat(path)
+        with self._lock:
+            cached = self.dirs.get(path)
+            if cached and field in cached and cached['mtime_ns'] == st.st_mtime_ns and cached['ino'] == st.st_ino:
+                return cached[field]
+        with os.scandir(path) as it:
+            value = scan(it)
+        with self._lock:
+            self.dirs[path] = {'mtime_ns': st.st_mtime_ns, 'ino': st.st_ino, field: value}
+            self._dirty = True
+        return value
+    
+    def count_dir(self, path):
+        """Number of entries in a directory; only the count is stored, so node_modules stays cheap"""
+        return self._scan_dir(path, 'count', lambda it: sum(1 for _ in it))
+    
+    def list_dir(self, path):
+        """Entry names of a directory, rescanning only when the directory itself changed"""
+        return self._scan_dir(path, 'entries', lambda it: sorted(entry.name for entry in it))
+    
+    def digest(self, path):
+        """Return (sha256, reused, previous_sha256) for a file, hashing only if size/mtime changed"""
+        st = os.stat(path)
+        with self._lock:
+            cached = self.hashes.get(path)
+        if cached and (cached['size'], cached['mtime_ns'], cached['ino']) == (st.st_size, st.st_mtime_ns, st.st_ino):
+            return cached['sha256'], True, cached['sha256']
+        sha = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                sha.update(chunk)
+        with self._lock:
+            self.bytes_hashed += st.st_size
+            self.hashes[path] = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'ino': st.st_ino,
+                                 'sha256': sha.hexdigest()}
+            self._dirty = True
+        return sha.hexdigest(), False, cached['sha256'] if cached else None
+    
+    def save(self):
+        """Write the cache if anything changed since the last save"""
+        # Held across the write, so an older snapshot can never replace a newer one
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with open(tmp_path, 'w') as f:
+                    json.dump({'dirs': self.dirs, 'hashes': self.hashes}, f)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError:
+                pass  # The cache is only an optimization; a read-only tree still gets scanned
 
 class HealthChecker:
-    def __init__(self):
+    # (header, method) in report order; checks run concurrently but print in this order
+    CHECKS = [
+        ("🖥️  SYSTEM INFORMATION", "check_system_info"),
+        ("🔥 GPU & COMPUTE", "check_gpu"),
+        ("📦 DEPENDENCIES", "check_dependencies"),
+        ("📁 PROJECT STRUCTURE", "check_project_structure"),
+        ("🔀 GIT REPOSITORY", "check_git_status"),
+        ("🚨 RECOVERY SYSTEM", "check_recovery_system"),
+    ]
+    INTEGRITY_CHECK = ("🔐 INTEGRITY", "check_integrity")
+    
+    CRITICAL_FILES = {
+        'package.json': 'Node.js configuration',
+        'next.config.js': 'Next.js configuration',
+        'tailwind.config.js': 'Tailwind CSS configuration',
+        'tsconfig.json': 'TypeScript configuration',
+        '.env.example': 'Environment variables template',
+        'README.md': 'Project documentation'
+    }
+    
+    CRITICAL_DIRS = {
+        'app/': 'Next.js app directory',
+        'claude-to-cash/': 'Core application',
+        'node_modules/': 'Node.js dependencies',
+        '.recovery/': 'Recovery system'
+    }
+    
+    RECOVERY_FILES = {
+        '.recovery/scripts/reanimate.sh': 'Main recovery script',
+        '.recovery/scripts/backup.sh': 'Backup script',
+        '.recovery/scripts/health_check.py': 'Health check script',
+        '.github/workflows/doomsday-backup.yml': 'Automated backup workflow'
+    }
+    
+    BACKUP_DIR = '.recovery/backups'
+    
+    def __init__(self, timeout=CHECK_TIMEOUT, deep=False, retention=REPORT_RETENTION,
+                 integrity=False, scan_cache=None, save=True):
         self.results = {}
+        self.save = save
+        self.timeout = timeout
+        self.deep = deep
+        self.retention = retention
+        self.integrity = integrity
+        self.scan_cache = scan_cache or ScanCache()
         self.start_time = time.time()
     
+    def enabled_checks(self):
+        return self.CHECKS + [self.INTEGRITY_CHECK] if self.integrity else list(self.CHECKS)
+    
     def check_system_info(self):
         """Check basic system information"""
         print_header("🖥️  SYSTEM INFORMATION")
@@ -54,11 +263,14 @@ class HealthChecker:
             
             # Python version
             python_version = sys.version.split()[0]
-            print_status("Python Version", "OK", f"v{python_version}")
-            self.results['python'] = {'status': 'OK', 'version': python_version}
+            started = time.perf_counter()
+            run_command([sys.executable, '-c', 'pass'], self.timeout)
+            startup_ms = round((time.perf_counter() - started) * 1000, 1)
+            print_status("Python Version", "OK", f"v{python_version} (interpreter startup {startup_ms:.0f}ms)")
+            self.results['python'] = {'status': 'OK', 'version': python_version, 'startup_ms': startup_ms}
             
             # Disk space
-            disk_usage = subprocess.run(['df', '-h', '.'], capture_output=True, text=True)
+            disk_usage = run_command(['df', '-h', '.'], self.timeout)
             if disk_usage.returncode == 0:
                 lines = disk_usage.stdout.strip().split('\n')
                 if len(lines) > 1:
@@ -77,9 +289,8 @@ class HealthChecker:
         
         try:
             # NVIDIA GPU check
-            result = subprocess.run(['nvidia-smi', '--query-gpu=name,memory.total,memory.used', 
-                                   '--format=csv,noheader,nounits'], 
-                                  capture_output=True, text=True)
+            result = run_command(['nvidia-smi', '--query-gpu=name,memory.total,memory.used', 
+                                  '--format=csv,noheader,nounits'], self.timeout)
             if result.returncode == 0:
                 gpu_info = result.stdout.strip()
                 print_status("NVIDIA GPU", "OK", gpu_info)
@@ -89,6 +300,17 @@ class HealthChecker:
                 
         except FileNotFoundError:
             # Check for other compute options
+            if not self.deep:
+                # Importing torch just to ask about CUDA costs seconds; without nvidia-smi assume CPU
+                torch_info = probe_package('torch')
+                if torch_info['status'] == 'OK':
+                    print_status("GPU", "CPU MODE", f"No nvidia-smi; PyTorch {torch_info['version']} installed "
+                                 "(use --deep to query CUDA)")
+                    self.results['gpu'] = {'status': 'CPU_MODE', 'type': 'cpu'}
+                else:
+                    print_status("GPU", "UNKNOWN", "PyTorch not installed")
+                    self.results['gpu'] = {'status': 'UNKNOWN', 'type': 'unknown'}
+                return
             try:
                 import torch
                 if torch.cuda.is_available():
@@ -107,44 +329,68 @@ class HealthChecker:
         """Check critical dependencies"""
         print_header("📦 DEPENDENCIES")
         
-        # Node.js & NPM
+        # Start the slow subprocesses first so they overlap with the Python package probes
         try:
-            node_version = subprocess.run(['node', '--version'], capture_output=True, text=True)
-            if node_version.returncode == 0:
-                version = node_version.stdout.strip()
-                print_status("Node.js", "OK", version)
-                self.results['nodejs'] = {'status': 'OK', 'version': version}
-            else:
-                raise FileNotFoundError()
+            node_process = start_command(['node', '--version'])
         except FileNotFoundError:
-            print_status("Node.js", "MISSING", "Not installed")
-            self.results['nodejs'] = {'status': 'MISSING'}
-        
-        # NPM packages
+            node_process = None
+        npm_process = None
+        npm_missing = False
         if os.path.exists('package.json'):
             try:
-                npm_check = subprocess.run(['npm', 'list', '--depth=0'], 
-                                         capture_output=True, text=True)
-                if npm_check.returncode == 0:
-                    print_status("NPM Packages", "OK", "All dependencies installed")
+                npm_process = start_command(['npm', 'list', '--depth=0'])
+            except FileNotFoundError:
+                npm_missing = True
+        
+        try:
+            # Python packages: metadata probe by default, real (timed) imports in deep mode
+            critical_packages = ['torch', 'transformers', 'numpy', 'pandas']
+            python_status = {}
+            for package in critical_packages:
+                python_status[package] = import_package(package) if self.deep else probe_package(package)
+            
+            # Node.js & NPM
+            try:
+                if node_process is None:
+                    raise FileNotFoundError()
+                node_version = finish_command(node_process, self.timeout)
+                if node_version.returncode == 0:
+                    version = node_version.stdout.strip()
+                    print_status("Node.js", "OK", version)
+                    self.results['nodejs'] = {'status': 'OK', 'version': version}
                 else:
-                    print_status("NPM Packages", "ISSUES", "Some packages may be missing")
-                self.results['npm_packages'] = {'status': 'OK' if npm_check.returncode == 0 else 'ISSUES'}
+                    raise FileNotFoundError()
             except FileNotFoundError:
+                print_status("Node.js", "MISSING", "Not installed")
+                self.results['nodejs'] = {'status': 'MISSING'}
+            except subprocess.TimeoutExpired:
+                print_status("Node.js", "TIMEOUT", f"No answer within {self.timeout:.0f}s")
+                self.results['nodejs'] = {'status': 'TIMEOUT'}
+            
+            # NPM packages
+            if npm_missing:
                 print_status("NPM", "MISSING", "NPM not installed")
+            elif npm_process is not None:
+                try:
+                    npm_check = finish_command(npm_process, self.timeout)
+                    if npm_check.returncode == 0:
+                        print_status("NPM Packages", "OK", "All dependencies installed")
+                    else:
+                        print_status("NPM Packages", "ISSUES", "Some packages may be missing")
+                    self.results['npm_packages'] = {'status': 'OK' if npm_check.returncode == 0 else 'ISSUES'}
+                except subprocess.TimeoutExpired:
+                    print_status("NPM Packages", "TIMEOUT", f"npm list took over {self.timeout:.0f}s")
+                    self.results['npm_packages'] = {'status': 'TIMEOUT'}
+        finally:
+            stop_commands(node_process, npm_process)
         
-        # Python packages
-        critical_packages = ['torch', 'transformers', 'numpy', 'pandas']
-        python_status = {}
-        
-        for package in critical_packages:
-            try:
-                __import__(package)
-                print_status(f"Python {package}", "OK", "Installed")
-                python_status[package] = 'OK'
-            except ImportError:
-                print_status(f"Python {package}", "MISSING", "Not installed")
-                python_status[package] = 'MISSING'
+        for package, info in python_status.items():
+            if info['status'] != 'OK':
+                print_status(f"Python {package}", info['status'], "Not installed")
+            elif 'import_ms' in info:
+                print_status(f"Python {package}", "OK", f"v{info['version']} (import {info['import_ms']:.0f}ms)")
+            else:
+                print_status(f"Python {package}", "OK", f"v{info['version']}")
         
         self.results['python_packages'] = python_status
     
@@ -152,40 +398,33 @@ class HealthChecker:
         """Check project structure and critical files"""
         print_header("📁 PROJECT STRUCTURE")
         
-        critical_files = {
-            'package.json': 'Node.js configuration',
-            'next.config.js': 'Next.js configuration',
-            'tailwind.config.js': 'Tailwind CSS configuration',
-            'tsconfig.json': 'TypeScript configuration',
-            '.env.example': 'Environment variables template',
-            'README.md': 'Project documentation'
-        }
-        
-        critical_dirs = {
-            'app/': 'Next.js app directory',
-            'claude-to-cash/': 'Core application',
-            'node_modules/': 'Node.js dependencies',
-            '.recovery/': 'Recovery system'
-        }
-        
         # Check files
-        for file, description in critical_files.items():
+        files = {}
+        for file, description in self.CRITICAL_FILES.items():
             if os.path.exists(file):
                 size = os.path.getsize(file)
                 print_status(file, "OK", f"{description} ({size} bytes)")
+                files[file] = {'status': 'OK', 'size': size}
             else:
                 print_status(file, "MISSING", description)
+                files[file] = {'status': 'MISSING'}
         
-        # Check directories
-        for dir_path, description in critical_dirs.items():
+        # Check directories (node_modules can hold tens of thousands of entries, so reuse cached listings)
+        dirs = {}
+        for dir_path, description in self.CRITICAL_DIRS.items():
             if os.path.exists(dir_path):
                 try:
-                    item_count = len(os.listdir(dir_path))
+                    item_count = self.scan_cache.count_dir(dir_path)
                     print_status(dir_path, "OK", f"{description} ({item_count} items)")
+                    dirs[dir_path] = {'status': 'OK', 'items': item_count}
                 except PermissionError:
                     print_status(dir_path, "OK", f"{description} (access restricted)")
+                    dirs[dir_path] = {'status': 'OK'}
             else:
                 print_status(dir_path, "MISSING", description)
+                dirs[dir_path] = {'status': 'MISSING'}
+        self.results['project_files'] = files
+        self.results['project_dirs'] = dirs
     
     def check_git_status(self):
         """Check Git repository status"""
@@ -193,17 +432,21 @@ class HealthChecker:
         
         try:
             # Check if it's a git repo
-            git_status = subprocess.run(['git', 'status', '--porcelain'], 
-                                      capture_output=True, text=True)
+            # Branch and last commit queries run alongside the (slower) status scan
+            processes = []
+            try:
+                for args in (['git', 'status', '--porcelain'], ['git', 'branch', '--show-current'],
+                             ['git', 'log', '-1', '--oneline']):
+                    processes.append(start_command(args))
+                git_status, branch, commit = (finish_command(process, self.timeout) for process in processes)
+            finally:
+                # A timeout on one query must not leave the others running
+                stop_commands(*processes)
             if git_status.returncode == 0:
                 # Get current branch
-                branch = subprocess.run(['git', 'branch', '--show-current'], 
-                                      capture_output=True, text=True)
                 current_branch = branch.stdout.strip() if branch.returncode == 0 else "unknown"
                 
                 # Get last commit
-                commit = subprocess.run(['git', 'log', '-1', '--oneline'], 
-                                      capture_output=True, text=True)
                 last_commit = commit.stdout.strip() if commit.returncode == 0 else "unknown"
                 
                 # Check for uncommitted changes
@@ -230,34 +473,74 @@ class HealthChecker:
         except subprocess.CalledProcessError:
             print_status("Git Repository", "NOT_A_REPO", "Not a git repository")
             self.results['git'] = {'status': 'NOT_A_REPO'}
+        except subprocess.TimeoutExpired:
+            print_status("Git Repository", "TIMEOUT", f"git took over {self.timeout:.0f}s")
+            self.results['git'] = {'status': 'TIMEOUT'}
     
     def check_recovery_system(self):
         """Check recovery system integrity"""
         print_header("🚨 RECOVERY SYSTEM")
         
-        recovery_files = {
-            '.recovery/scripts/reanimate.sh': 'Main recovery script',
-            '.recovery/scripts/backup.sh': 'Backup script',
-            '.recovery/scripts/health_check.py': 'Health check script',
-            '.github/workflows/doomsday-backup.yml': 'Automated backup workflow'
-        }
-        
-        for file, description in recovery_files.items():
+        files = {}
+        for file, description in self.RECOVERY_FILES.items():
             if os.path.exists(file):
                 # Check if executable
                 is_executable = os.access(file, os.X_OK)
                 status = "OK" if is_executable else "OK (not executable)"
                 print_status(file, status, description)
             else:
-                print_status(file, "MISSING", description)
+                status = "MISSING"
+                print_status(file, status, description)
+            files[file] = {'status': status}
+        self.results['recovery_files'] = files
         
         # Check backup directory
-        backup_dir = '.recovery/backups'
-        if os.path.exists(backup_dir):
-            backups = [f for f in os.listdir(backup_dir) if f.endswith('.tar.gz')]
+        if os.path.exists(self.BACKUP_DIR):
+            backups = self._list_backups()
             print_status("Backup Directory", "OK", f"{len(backups)} backups available")
+            self.results['backups'] = {'status': 'OK', 'count': len(backups)}
         else:
             print_status("Backup Directory", "MISSING", "No backups found")
+            self.results['backups'] = {'status': 'MISSING'}
+    
+    def _list_backups(self):
+        return [f for f in self.scan_cache.list_dir(self.BACKUP_DIR) if f.endswith('.tar.gz')]
+    
+    def check_integrity(self):
+        """Hash critical files and backup tarballs, re-reading only files whose size or mtime changed"""
+        print_header("🔐 INTEGRITY")
+        
+        files = [f for f in list(self.CRITICAL_FILES) + list(self.RECOVERY_FILES) if os.path.exists(f)]
+        if os.path.exists(self.BACKUP_DIR):
+            files += [os.path.join(self.BACKUP_DIR, name) for name in self._list_backups()]
+        
+        hashes = {}
+        changed = []
+        reused = 0
+        bytes_before = self.scan_cache.bytes_hashed
+        for path in files:
+            sha, was_reused, previous = self.scan_cache.digest(path)
+            hashes[path] = sha
+            reused += was_reused
+            if not was_reused:
+                self.scan_cache.save()  # Keep progress on large backups even if this run is cut short
+            if previous and previous != sha and path.startswith(self.BACKUP_DIR):
+                # Backups are written once; new contents under the same name deserve a look
+                print_status(path, "WARNING", f"Contents changed since last verification (sha256 {sha[:12]})")
+                changed.append(path)
+        
+        bytes_read = self.scan_cache.bytes_hashed - bytes_before
+        print_status("File Hashes", "OK",
+                     f"{len(files)} files verified, {len(files) - reused} re-hashed ({bytes_read / 1e6:.1f} MB read), "
+                     f"{reused} unchanged")
+        self.results['integrity'] = {
+            'status': 'WARNING' if changed else 'OK',
+            'files': len(files),
+            'changed': changed,
+            'rehashed': len(files) - reused,
+            'bytes_read': bytes_read,
+            'sha256': hashes
+        }
     
     def run_comprehensive_check(self):
         """Run all health checks"""
@@ -265,44 +548,63 @@ class HealthChecker:
         print(f"{Colors.YELLOW}⚡ Scanning system... Hold onto your coffee!{Colors.NC}")
         print(f"{Colors.CYAN}⏰ Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{Colors.NC}")
         
-        # Run all checks
-        self.check_system_info()
-        self.check_gpu()
-        self.check_dependencies()
-        self.check_project_structure()
-        self.check_git_status()
-        self.check_recovery_system()
+        # Run all checks concurrently; the scan takes as long as the slowest check
+        for run in self.run_checks(self.enabled_checks()):
+            print("\n".join(run['lines']))
+        # Once, after every check has had its turn, and only if a scan or hash changed
+        self.scan_cache.save()
         
         # Generate summary
-        self.generate_summary()
+        return self.generate_summary()
+    
+    def run_checks(self, checks):
+        """Run (header, method) checks concurrently, returning their buffered output in order"""
+        runs = []
+        for header, method in checks:
+            run = {'header': header, 'method': method, 'lines': [], 'error': None}
+            run['thread'] = threading.Thread(target=self._run_check, args=(run,), daemon=True)
+            run['thread'].start()
+            runs.append(run)
+        
+        deadline = time.time() + self.timeout
+        for run in runs:
+            if run['method'] == self.INTEGRITY_CHECK[1]:
+                # Opt-in and disk-bound: a first pass over large backups may legitimately outlast the budget
+                run['thread'].join()
+            else:
+                run['thread'].join(max(0.0, deadline - time.time()))
+            if run['thread'].is_alive():
+                # A hung check is abandoned (daemon thread) and reported in its place
+                run['lines'] = []
+                _output.lines = run['lines']
+                print_header(run['header'])
+                print_status(run['method'], "TIMEOUT", f"Did not finish within {self.timeout:.0f}s")
+                self.results[run['method']] = {'status': 'TIMEOUT'}
+                _output.lines = None
+            elif run['error']:
+                _output.lines = run['lines']
+                print_status(run['method'], "FAIL", run['error'])
+                self.results[run['method']] = {'status': 'FAIL', 'error': run['error']}
+                _output.lines = None
+        return runs
+    
+    def _run_check(self, run):
+        _output.lines = run['lines']
+        try:
+            getattr(self, run['method'])()
+        except Exception as e:
+            run['error'] = str(e)
     
     def generate_summary(self):
         """Generate final summary report"""
         print_header("📊 HEALTH SUMMARY")
         
         total_time = time.time() - self.start_time
+        # Snapshot, since an abandoned (timed-out) check may still be writing results
+        results = dict(self.results)
         
         # Count statuses
-        ok_count = 0
-        warning_count = 0
-        error_count = 0
-        
-        def count_status(data):
-            nonlocal ok_count, warning_count, error_count
-            if isinstance(data, dict):
-                if 'status' in data:
-                    status = data['status']
-                    if 'OK' in status or 'CLEAN' in status:
-                        ok_count += 1
-                    elif 'WARNING' in status or 'MISSING' in status or 'CPU_MODE' in status:
-                        warning_count += 1
-                    else:
-                        error_count += 1
-                for value in data.values():
-                    if isinstance(value, dict):
-                        count_status(value)
-        
-        count_status(self.results)
+        ok_count, warning_count, error_count = count_statuses(results)
         
         print(f"   {Colors.GREEN}✅ OK: {ok_count}{Colors.NC}")
         print(f"   {Colors.YELLOW}⚠️  WARNINGS: {warning_count}{Colors.NC}")
@@ -320,26 +622,244 @@ class HealthChecker:
         print(f"\n{Colors.BOLD}OVERALL STATUS: {overall_status}{Colors.NC}")
         
         # Save report
-        report_file = f".recovery/health_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_file, 'w') as f:
-            json.dump({
-                'timestamp': datetime.now().isoformat(),
-                'summary': {
-                    'ok': ok_count,
-                    'warnings': warning_count,
-                    'errors': error_count,
-                    'scan_time': total_time
-                },
-                'details': self.results
-            }, f, indent=2)
-        
-        print(f"\n{Colors.BLUE}📋 Detailed report saved: {report_file}{Colors.NC}")
+        if self.save:
+            report_file = save_report({
+                'ok': ok_count,
+                'warnings': warning_count,
+                'errors': error_count,
+                'scan_time': total_time
+            }, results)
+            prune_reports(self.retention)
+            
+            print(f"\n{Colors.BLUE}📋 Detailed report saved: {report_file}{Colors.NC}")
         
-        # Return exit code
+        # Exit code: non-zero only when a check failed or timed out
         return 0 if error_count == 0 else 1
 
+def count_statuses(results):
+    """Count OK / warning / error statuses anywhere in a results tree
+    
+    Only checks that actually failed (FAIL, TIMEOUT) are errors. Anything else
+    short of OK, such as a GPU reported as UNKNOWN on a CPU-only host, is a warning.
+    """
+    counts = {'ok': 0, 'warnings': 0, 'errors': 0}
+    
+    def count_status(data):
+        if isinstance(data, dict):
+            if 'status' in data:
+                status = data['status']
+                if 'OK' in status or 'CLEAN' in status:
+                    counts['ok'] += 1
+                elif status in FAILURE_STATUSES:
+                    counts['errors'] += 1
+                else:
+                    counts['warnings'] += 1
+            for value in data.values():
+                if isinstance(value, dict):
+                    count_status(value)
+    
+    count_status(results)
+    return counts['ok'], counts['warnings'], counts['errors']
+
+def save_report(summary, results):
+    """Write a timestamped JSON health report and return its path"""
+    report_file = os.path.join(REPORT_DIR, f"health_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(report_file, 'w') as f:
+        json.dump({
+            'timestamp': datetime.now().isoformat(),
+            'summary': summary,
+            'details': results
+        }, f, indent=2)
+    return report_file
+
+def prune_reports(retention=REPORT_RETENTION):
+    """Keep the newest `retention` reports; older ones shrink to one summary line in the history file"""
+    reports = sorted(f for f in os.listdir(REPORT_DIR) if f.startswith('health_report_') and f.endswith('.json'))
+    expired = reports[:max(0, len(reports) - retention)]
+    if not expired:
+        return
+    
+    history_file = os.path.join(REPORT_DIR, HISTORY_FILE)
+    with open(history_file, 'a') as history:
+        for name in expired:
+            path = os.path.join(REPORT_DIR, name)
+            try:
+                with open(path) as f:
+                    report = json.load(f)
+                history.write(json.dumps({'timestamp': report.get('timestamp'),
+                                          'summary': report.get('summary')}) + "\n")
+            except (OSError, ValueError):
+                pass  # An unreadable report is dropped without a history entry
+            os.remove(path)
+    
+    with open(history_file) as f:
+        lines = f.readlines()
+    if len(lines) > HISTORY_LIMIT:
+        with open(history_file, 'w') as f:
+            f.writelines(lines[-HISTORY_LIMIT:])
+
+class HealthDaemon:
+    """Keep health results fresh in memory and serve them over HTTP
+    
+    Each check refreshes on its own interval in a background thread. The JSON
+    served by the probe endpoints is pre-serialized whenever a check finishes,
+    so requests never wait on a scan. Reports are written only when a check's
+    outcome changes.
+    """
+    
+    # Seconds between refreshes of each check
+    INTERVALS = {
+        'check_system_info': 60,
+        'check_gpu': 300,
+        'check_dependencies': 600,
+        'check_project_structure': 60,
+        'check_git_status': 30,
+        'check_recovery_system': 120,
+        'check_integrity': 300,
+    }
+    
+    def __init__(self, timeout=CHECK_TIMEOUT, deep=False, retention=REPORT_RETENTION, interval=None,
+                 integrity=False):
+        self.timeout = timeout
+        self.deep = deep
+        self.retention = retention
+        self.interval = interval
+        self.integrity = integrity
+        # Shared so concurrent refreshes do not overwrite each other's cache entries
+        self.scan_cache = ScanCache()
+        self.enabled_checks = HealthChecker(integrity=integrity, scan_cache=self.scan_cache).enabled_checks()
+        self.checks = {}
+        self.ready = False
+        self._lock = threading.Lock()
+        self._last_signature = None
+        self._bodies = {}
+        self._healthy = False
+    
+    def _refresh_loop(self, header, method):
+        while True:
+            started = time.time()
+            checker = HealthChecker(timeout=self.timeout, deep=self.deep, scan_cache=self.scan_cache)
+            checker.run_checks([(header, method)])
+            self.scan_cache.save()
+            self._update(method, dict(checker.results), time.time() - started)
+            time.sleep(self.interval or self.INTERVALS.get(method, 60))
+    
+    def _update(self, method, results, duration):
+        with self._lock:
+            self.checks[method] = {
+                'results': results,
+                'updated': datetime.now().isoformat(),
+                'duration_ms': round(duration * 1000, 1),
+            }
+            merged = {}
+            for check in self.checks.values():
+                merged.update(check['results'])
+            ok_count, warning_count, error_count = count_statuses(merged)
+            summary = {'ok': ok_count, 'warnings': warning_count, 'errors': error_count}
+            self.ready = len(self.checks) == len(self.enabled_checks)
+            
+            bodies = {'/health': json.dumps({'ready': self.ready, 'summary': summary,
+                                             'checks': self.checks}).encode()}
+            for name, check in self.checks.items():
+                bodies[f'/health/{name}'] = json.dumps(check).encode()
+            self._bodies = bodies
+            self._healthy = self.ready and error_count == 0
+            
+            # Timings and work counters change on every run, so they do not count as a state change
+            signature = json.dumps(strip_timings(merged), sort_keys=True)
+            changed = self.ready and signature != self._last_signature
+            if changed:
+                self._last_signature = signature
+        
+        if changed:
+            report_file = save_report(summary, merged)
+            prune_reports(self.retention)
+            print(f"{Colors.BLUE}📋 Health state changed, report saved: {report_file}{Colors.NC}")
+    
+    def serve(self, host, port):
+        for header, method in self.enabled_checks:
+            threading.Thread(target=self._refresh_loop, args=(header, method), daemon=True).start()
+        
+        daemon = self
+        
+        class ProbeHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == '/live':
+                    self._send(200, b'{"live": true}')
+                    return
+                body = daemon._bodies.get(self.path.rstrip('/') or '/health')
+                if body is None:
+                    self._send(404, b'{"error": "not found"}')
+                elif self.path.startswith('/health/'):
+                    self._send(200, body)
+                else:
+                    # Readiness: 503 until every check has reported and none failed or timed out
+                    self._send(200 if daemon._healthy else 503, body)
+            
+            def _send(self, status, body):
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass  # Probes hit this every few seconds; keep the daemon log for state changes
+        
+        server = ThreadingHTTPServer((host, port), ProbeHandler)
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        print(f"{Colors.GREEN}🏥 Health daemon serving http://{host}:{port}/health{Colors.NC}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        return 0
+
+# Per-run counters that say how much work a run did, not what state the system is in
+RUN_COUNTER_FIELDS = {'rehashed', 'bytes_read'}
+
+def strip_timings(data):
+    """Copy of a results tree without per-run timing fields (*_ms) and work counters"""
+    if isinstance(data, dict):
+        return {key: strip_timings(value) for key, value in data.items()
+                if not key.endswith('_ms') and key not in RUN_COUNTER_FIELDS}
+    return data
+
 def main():
-    checker = HealthChecker()
+    parser = argparse.ArgumentParser(description="🏥 GOAT AI comprehensive health check")
+    parser.add_argument('--timeout', type=float, default=CHECK_TIMEOUT,
+                        help=f"Seconds each check may take before it is reported as TIMEOUT (default {CHECK_TIMEOUT:.0f})")
+    parser.add_argument('--quick', action='store_true',
+                        help=f"Probe mode: {QUICK_TIMEOUT:.0f}s per-check budget and no report file")
+    parser.add_argument('--silent', action='store_true',
+                        help="Print nothing; the exit status carries the result")
+    parser.add_argument('--deep', action='store_true',
+                        help="Import Python packages (and torch for CUDA) instead of probing metadata, timing each import")
+    parser.add_argument('--integrity', action='store_true',
+                        help="Also hash critical files and backup tarballs (only changed files are re-read; not subject to --timeout)")
+    parser.add_argument('--retention', type=int, default=REPORT_RETENTION,
+                        help=f"Health reports to keep before compacting into {HISTORY_FILE} (default {REPORT_RETENTION})")
+    parser.add_argument('--daemon', action='store_true',
+                        help="Keep checks fresh in the background and serve results over HTTP")
+    parser.add_argument('--host', default='127.0.0.1', help="Bind address for --daemon")
+    parser.add_argument('--port', type=int, default=8090, help="Port for --daemon (default 8090)")
+    parser.add_argument('--interval', type=float,
+                        help="Refresh every check at this many seconds instead of the per-check defaults")
+    args = parser.parse_args()
+    
+    if args.daemon:
+        daemon = HealthDaemon(timeout=args.timeout, deep=args.deep, retention=args.retention, interval=args.interval,
+                              integrity=args.integrity)
+        return daemon.serve(args.host, args.port)
+    
+    timeout = min(args.timeout, QUICK_TIMEOUT) if args.quick else args.timeout
+    checker = HealthChecker(timeout=timeout, deep=args.deep, retention=args.retention,
+                            integrity=args.integrity, save=not args.quick)
+    if args.silent:
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            return checker.run_comprehensive_check()
     return checker.run_comprehensive_check()
 
 if __name__ == "__main__":
@@ -35,6 +35,8 @@ cat >> .gitignore << 'EOF'
 claude-fast-complete-system.tar.gz
 .recovery/backups/*.tar.gz
 .recovery/health_report_*.json
+.recovery/health_history.jsonl
+.recovery/.cache/
 
 # Environment files
 .env.local
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+⏱️ GOAT Launcher Benchmark Harness
+Cold start, warm latency and concurrent throughput, as comparable JSON
+"""
+
+import io
+import sys
+import json
+import time
+import platform
+import argparse
+import statistics
+import subprocess
+import importlib.util
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+LAUNCHER_PATH = Path(__file__).resolve().parent / "goat-launcher.py"
+BENCH_TASKS = {
+    "coding": "Fix React hydration error",
+    "saas": "MRR forecast and analysis",
+    "deployment": "Generate K8s config for Next.js app",
+    "support": "Handle customer refund request"
+}
+DEFAULT_PARALLELISM = [1, 2, 4, 8, 16]
+
+# Metrics where a larger number is better; everything else is a latency
+HIGHER_IS_BETTER = ("tasks_per_sec",)
+
+def load_launcher():
+    """Import goat-launcher.py, whose hyphenated name rules out a plain import"""
+    spec = importlib.util.spec_from_file_location("goat_launcher", LAUNCHER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def describe(launcher, samples_ms: List[float]) -> Dict:
+    """Summary of a sample set, with percentiles computed exactly as the launcher's /metrics does"""
+    ordered = sorted(samples_ms)
+    return {
+        "runs": len(ordered),
+        "min_ms": round(ordered[0], 2),
+        "p50_ms": round(statistics.median(ordered), 2),
+        "p95_ms": round(launcher.percentile(ordered, 95), 2),
+        "max_ms": round(ordered[-1], 2)
+    }
+
+def bench_cold_start(launcher, backend: str, runs: int) -> Dict:
+    """Fresh interpreter, launcher import and adapter load, as a workflow script pays it"""
+    code = (
+        "import importlib.util, time; t = time.perf_counter(); "
+        f"spec = importlib.util.spec_from_file_location('goat_launcher', {str(LAUNCHER_PATH)!r}); "
+        "m = importlib.util.module_from_spec(spec); spec.loader.exec_module(m); "
+        f"m.GOATModel(cache_size=0, metrics_file=None, backend={backend!r}); "
+        "print((time.perf_counter() - t) * 1000)"
+    )
+    process_ms, in_process_ms = [], []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        process_ms.append((time.perf_counter() - started) * 1000)
+        in_process_ms.append(float(result.stdout.strip().splitlines()[-1]))
+    return {"process": describe(launcher, process_ms), "import_and_load": describe(launcher, in_process_ms)}
+
+def bench_warm_latency(launcher, backend: str, runs: int) -> Dict:
+    """Per-adapter latency and time-to-first-token on an already loaded model, cache disabled"""
+    goat = launcher.GOATModel(cache_size=0, metrics_file=None, backend=backend)
+    results = {}
+    for adapter, task in BENCH_TASKS.items():
+        latencies, first_tokens = [], []
+        for _ in range(runs):
+            started = time.perf_counter()
+            with redirect_stdout(io.StringIO()):
+                goat.generate(task, adapter)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+            started = time.perf_counter()
+            first_token = None
+            for _chunk in goat.generate_stream(task, adapter):
+                if first_token is None:
+                    first_token = time.perf_counter()
+            first_tokens.append(((first_token or time.perf_counter()) - started) * 1000)
+        results[adapter] = {"latency": describe(launcher, latencies), "ttft": describe(launcher, first_tokens)}
+    return results
+
+def bench_throughput(launcher, backend: str, levels: List[int], tasks_per_worker: int) -> List[Dict]:
+    """Unbatched tasks (max_batch_size=1) so throughput reflects concurrency alone"""
+    goat = launcher.GOATModel(cache_size=0, metrics_file=None, backend=backend)
+    adapters = list(BENCH_TASKS)
+    results = []
+    for parallelism in levels:
+        count = parallelism * tasks_per_worker
+        requests = [{"adapter": adapters[i % len(adapters)], "task": f"{BENCH_TASKS[adapters[i % len(adapters)]]} #{i}"}
+                    for i in range(count)]
+        started = time.perf_counter()
+        completed = sum(1 for result in goat.generate_batch(requests, parallelism=parallelism, max_batch_size=1)
+                        if "result" in result)
+        elapsed = time.perf_counter() - started
+        results.append({
+            "parallelism": parallelism,
+            "tasks": completed,
+            "seconds": round(elapsed, 3),
+            "tasks_per_sec": round(completed / elapsed, 2)
+        })
+    return results
+
+def flatten(report: Dict) -> Dict[str, float]:
+    """Comparable scalar metrics keyed by a dotted path"""
+    flat = {}
+    for kind, stats in report["cold_start"].items():
+        flat[f"cold_start.{kind}.p50_ms"] = stats["p50_ms"]
+    for adapter, stats in report["warm_latency"].items():
+        flat[f"warm_latency.{adapter}.p50_ms"] = stats["latency"]["p50_ms"]
+        flat[f"warm_latency.{adapter}.ttft_p50_ms"] = stats["ttft"]["p50_ms"]
+    for level in report["throughput"]:
+        flat[f"throughput.p{level['parallelism']}.tasks_per_sec"] = level["tasks_per_sec"]
+    return flat
+
+def compare(report: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Print a comparison table and return the metrics that regressed past threshold"""
+    current, previous = flatten(report), flatten(baseline)
+    regressions = []
+    print(f"{'Metric':<44} {'Baseline':>10} {'Current':>10} {'Change':>8}", file=sys.stderr)
+    for name, value in current.items():
+        if name not in previous or not previous[name]:
+            continue
+        change = (value - previous[name]) / previous[name]
+        worse = -change if name.endswith(HIGHER_IS_BETTER) else change
+        marker = "❌" if worse > threshold else "✅"
+        print(f"{name:<44} {previous[name]:>10.2f} {value:>10.2f} {change:>+7.1%} {marker}", file=sys.stderr)
+        if worse > threshold:
+            regressions.append(name)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="⏱️ GOAT launcher benchmark harness")
+    parser.add_argument("--backend", default="simulated",
+                       help="Inference backend to benchmark (name or module:Class)")
+    parser.add_argument("--runs", type=int, default=5, help="Repetitions for cold start and warm latency")
+    parser.add_argument("--parallelism", type=int, nargs="+", default=DEFAULT_PARALLELISM,
+                       help="Concurrency levels for the throughput sweep")
+    parser.add_argument("--tasks-per-worker", type=int, default=4,
+                       help="Tasks submitted per unit of parallelism in the throughput sweep")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    parser.add_argument("--compare", metavar="BASELINE", help="Compare against a saved JSON report")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                       help="Allowed relative regression before --compare fails (default 10%%)")
+    args = parser.parse_args()
+
+    launcher = load_launcher()
+    print(f"⏱️  Benchmarking backend '{args.backend}'...", file=sys.stderr)
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "backend": args.backend,
+            "python": platform.python_version(),
+            "platform": platform.platform()
+        },
+        "cold_start": bench_cold_start(launcher, args.backend, args.runs),
+        "warm_latency": bench_warm_latency(launcher, args.backend, args.runs),
+        "throughput": bench_throughput(launcher, args.backend, args.parallelism, args.tasks_per_worker)
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"📋 Benchmark report saved: {args.output}", file=sys.stderr)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"🚨 {len(regressions)} metric(s) regressed more than {args.threshold:.0%}", file=sys.stderr)
+            return 1
+        print("🎉 No regressions against baseline", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,19 +8,32 @@ from lightning.app.components import ServeGradio
 import subprocess
 import os
 
+from lightning_build import BuildStage
+from lightning_supervisor import ProcessSupervisor
+
 class NextJSComponent(L.LightningWork):
     def __init__(self, **kwargs):
         super().__init__(**kwargs, port=3000)
+        # Per-phase build seconds, synced to the flow so replica cold starts can be compared
+        self.build_timings = {}
+        # Seconds from spawn to first HTTP response, per server process
+        self.startup_latency = []
+        self.ready = False
+        self.restarts = 0
         
     def run(self):
-        # Install Node.js dependencies
-        subprocess.run(["npm", "install"], check=True)
-        
-        # Build the Next.js application
-        subprocess.run(["npm", "run", "build"], check=True)
+        # Install dependencies and build, restoring both from the build cache when unchanged
+        self.build_timings = BuildStage(install_command=["npm", "install"]).run()
         
-        # Start the Next.js server
-        subprocess.run(["npm", "start"], check=False)
+        # Start one Next.js server per core behind port 3000 and keep them running
+        supervisor = ProcessSupervisor(port=3000, on_change=self._sync_supervisor)
+        supervisor.start()
+        supervisor.supervise()
+
+    def _sync_supervisor(self, supervisor):
+        self.startup_latency = supervisor.startup_seconds
+        self.ready = all(server.ready for server in supervisor.servers)
+        self.restarts = supervisor.restarts
 
 class ClaudeFastApp(L.LightningApp):
     def __init__(self):
@@ -8,9 +8,18 @@ import subprocess
 import os
 import time
 
+from lightning_build import BuildStage
+from lightning_supervisor import ProcessSupervisor
+
 class ClaudeFastServer(L.LightningWork):
     def __init__(self, **kwargs):
         super().__init__(**kwargs, port=3000)
+        # Per-phase build seconds, synced to the flow so replica cold starts can be compared
+        self.build_timings = {}
+        # Seconds from spawn to first HTTP response, per server process
+        self.startup_latency = []
+        self.ready = False
+        self.restarts = 0
         
     def run(self):
         # Set environment variables
@@ -18,23 +27,26 @@ class ClaudeFastServer(L.LightningWork):
         os.environ["PORT"] = "3000"
         
         try:
-            # Install dependencies
-            print("📦 Installing dependencies...")
-            subprocess.run(["npm", "ci"], check=True, cwd="/content")
-            
-            # Build the application
-            print("🔨 Building application...")
-            subprocess.run(["npm", "run", "build"], check=True, cwd="/content")
+            # Install dependencies and build, skipping whatever the build cache already has
+            print("📦 Preparing build...")
+            self.build_timings = BuildStage(root="/content", install_command=["npm", "ci"]).run()
             
-            # Start the server
-            print("🚀 Starting server on port 3000...")
-            subprocess.run(["npm", "start"], cwd="/content")
+            # Start one server per core behind port 3000; returns once all answer HTTP
+            supervisor = ProcessSupervisor(cwd="/content", port=3000, on_change=self._sync_supervisor)
+            supervisor.start()
             
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, RuntimeError) as e:
+            # Never fall back to the dev server in production; fail the work instead
             print(f"❌ Error: {e}")
-            # Fallback to development mode
-            print("🔄 Falling back to development mode...")
-            subprocess.run(["npm", "run", "dev"], cwd="/content")
+            raise
+        
+        # Restart crashed servers with backoff for as long as the work runs
+        supervisor.supervise()
+
+    def _sync_supervisor(self, supervisor):
+        self.startup_latency = supervisor.startup_seconds
+        self.ready = all(server.ready for server in supervisor.servers)
+        self.restarts = supervisor.restarts
 
 class ClaudeFastApp(L.LightningApp):
     def __init__(self):
@@ -0,0 +1,143 @@
+"""
+Cached build stage for the Claude Fast Lightning works
+Restores node_modules and .next from a content-addressed cache instead of rebuilding
+"""
+
+import hashlib
+import os
+import shutil
+import subprocess
+import tarfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# Everything `next build` reads; a change to any of these invalidates the cached .next
+SOURCE_PATHS = [
+    "app", "lib", "pages", "public", "components", "styles",
+    "middleware.ts", "next.config.js", "next-env.d.ts", "tailwind.config.js",
+    "postcss.config.js", "tsconfig.json", "package.json",
+    # The env files `next build` loads; their NEXT_PUBLIC_* values are inlined into the bundle
+    ".env", ".env.local", ".env.production", ".env.production.local",
+]
+SKIP_DIRS = {"node_modules", ".next", ".git", "__pycache__"}
+CACHE_DIR = os.environ.get("CLAUDE_FAST_BUILD_CACHE", os.path.expanduser("~/.cache/claude-fast/builds"))
+CACHE_RETENTION = 5
+KEY_STAMP = ".claude-fast-build-key"
+
+def _hash_path(digest, root, relative):
+    path = root / relative
+    if path.is_file():
+        digest.update(relative.encode())
+        digest.update(path.read_bytes())
+    elif path.is_dir():
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+            for name in sorted(filenames):
+                file_path = Path(dirpath) / name
+                digest.update(str(file_path.relative_to(root)).encode())
+                digest.update(file_path.read_bytes())
+
+class BuildStage:
+    """Install dependencies and build the Next.js app, reusing cached artifacts
+
+    node_modules is keyed on package.json, package-lock.json and the install command;
+    .next is keyed on that plus every source file, the .env files Next.js loads
+    and every NEXT_PUBLIC_* variable (Next.js inlines those at build time).
+    Each phase is timed so cold starts can be compared across replicas.
+    """
+
+    def __init__(self, root=".", install_command=("npm", "ci"), cache_dir=CACHE_DIR, retention=CACHE_RETENTION):
+        self.root = Path(root).resolve()
+        self.install_command = list(install_command)
+        self.cache_dir = Path(cache_dir)
+        self.retention = retention
+        self.timings = {}
+
+    @contextmanager
+    def phase(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = round(time.perf_counter() - started, 3)
+
+    def dependency_key(self):
+        digest = hashlib.sha256(" ".join(self.install_command).encode())
+        # package.json too: `npm install` resolves from it even when there is no lockfile
+        _hash_path(digest, self.root, "package.json")
+        _hash_path(digest, self.root, "package-lock.json")
+        return digest.hexdigest()
+
+    def build_key(self, dependency_key):
+        digest = hashlib.sha256(dependency_key.encode())
+        for relative in SOURCE_PATHS:
+            _hash_path(digest, self.root, relative)
+        for name in sorted(os.environ):
+            if name.startswith("NEXT_PUBLIC_"):
+                digest.update(f"{name}={os.environ[name]}".encode())
+        return digest.hexdigest()
+
+    def run(self):
+        """Bring node_modules and .next up to date, returning per-phase timings in seconds"""
+        with self.phase("hash"):
+            dependency_key = self.dependency_key()
+            build_key = self.build_key(dependency_key)
+
+        self._ensure("node_modules", dependency_key, "install", self.install_command)
+        self._ensure(".next", build_key, "build", ["npm", "run", "build"])
+
+        with self.phase("prune"):
+            self._prune()
+
+        total = sum(self.timings.values())
+        print(f"⏱️  Build stage finished in {total:.1f}s: "
+              + ", ".join(f"{name} {seconds:.1f}s" for name, seconds in self.timings.items()))
+        return dict(self.timings)
+
+    def _ensure(self, directory, key, phase, command):
+        target = self.root / directory
+        stamp = target / KEY_STAMP
+        archive = self.cache_dir / key[:2] / key / f"{directory.lstrip('.')}.tar"
+
+        if stamp.is_file() and stamp.read_text().strip() == key:
+            print(f"✅ {directory} is current ({key[:12]}), skipping {phase}")
+            self.timings[phase] = 0.0
+            if archive.parent.is_dir():
+                os.utime(archive.parent)  # Still in use, so keep it out of _prune()'s reach
+            return
+
+        if archive.is_file():
+            print(f"📦 Restoring {directory} from cache ({key[:12]})...")
+            with self.phase(f"restore_{phase}"):
+                shutil.rmtree(target, ignore_errors=True)
+                with tarfile.open(archive) as tar:
+                    if hasattr(tarfile, "tar_filter"):
+                        tar.extractall(self.root, filter="tar")
+                    else:
+                        tar.extractall(self.root)
+            stamp.write_text(key)
+            os.utime(archive.parent)  # Mark as recently used for _prune()
+            return
+
+        print(f"🔨 Running {' '.join(command)} (cache miss {key[:12]})...")
+        with self.phase(phase):
+            subprocess.run(command, check=True, cwd=self.root)
+        stamp.write_text(key)
+
+        with self.phase(f"store_{phase}"):
+            archive.parent.mkdir(parents=True, exist_ok=True)
+            tmp_archive = archive.with_suffix(".tar.tmp")
+            with tarfile.open(tmp_archive, "w") as tar:
+                tar.add(target, arcname=directory)
+            os.replace(tmp_archive, archive)
+
+    def _prune(self):
+        """Drop all but the newest `retention` cached artifact sets"""
+        if not self.cache_dir.is_dir():
+            return
+        entries = sorted((entry for shard in self.cache_dir.iterdir() if shard.is_dir()
+                          for entry in shard.iterdir() if entry.is_dir()),
+                         key=lambda entry: entry.stat().st_mtime, reverse=True)
+        for entry in entries[self.retention * 2:]:  # Each build has a dependency and a build entry
+            shutil.rmtree(entry, ignore_errors=True)
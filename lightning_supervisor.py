@@ -0,0 +1,284 @@
+"""
+Process supervisor for the Claude Fast Lightning works
+Starts Next.js servers without blocking, waits for readiness, restarts crashes with backoff,
+and spreads traffic over one server per core behind the work's port
+"""
+
+import asyncio
+import atexit
+import http.client
+import itertools
+import math
+import os
+import subprocess
+import threading
+import time
+
+READY_TIMEOUT = 120.0
+POLL_INTERVAL = 0.25
+# Running servers are probed this often; after UNHEALTHY_AFTER misses in a row they leave the rotation
+HEALTH_INTERVAL = 2.0
+UNHEALTHY_AFTER = 3
+BACKOFF_INITIAL = 1.0
+BACKOFF_MAX = 30.0
+# A server that stays up this long is considered healthy again, resetting its backoff
+STABLE_AFTER = 60.0
+# Each Next.js server carries its own heap, so the default stays below what a small work can hold
+MAX_WORKERS = 4
+PROXY_CHUNK_SIZE = 64 * 1024
+
+def available_cpus():
+    """CPUs this process may use: the affinity mask, further limited by a cgroup v2 CPU quota"""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS
+        cpus = os.cpu_count() or 1
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+def probe(port, host="127.0.0.1", timeout=2.0):
+    """True when the port answers an HTTP request with any status"""
+    try:
+        conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        try:
+            conn.request("GET", "/")
+            conn.getresponse().read()
+        finally:
+            conn.close()
+        return True
+    except (OSError, http.client.HTTPException):
+        return False
+
+def wait_until_ready(port, process=None, host="127.0.0.1", timeout=READY_TIMEOUT):
+    """Poll until the port answers HTTP; returns seconds waited, or None on timeout or exit"""
+    started = time.perf_counter()
+    while time.perf_counter() - started < timeout:
+        if process is not None and process.poll() is not None:
+            return None
+        if probe(port, host):
+            return time.perf_counter() - started
+        time.sleep(POLL_INTERVAL)
+    return None
+
+class ServerProcess:
+    """One supervised server bound to its own port"""
+
+    def __init__(self, index, port, command, cwd, env):
+        self.index = index
+        self.port = port
+        self.command = command
+        self.cwd = cwd
+        self.env = env
+        self.process = None
+        self.ready = False
+        self.started_at = None
+        self.restarts = 0
+        self.failures = 0
+        self.startup_seconds = None
+        # Set once the first start attempt is either ready or has given up
+        self.settled = threading.Event()
+
+    def start(self):
+        env = dict(self.env, PORT=str(self.port))
+        self.process = subprocess.Popen(self.command + ["--", "-p", str(self.port)], cwd=self.cwd, env=env)
+        self.started_at = time.perf_counter()
+        self.ready = False
+
+    def wait_ready(self, timeout):
+        waited = wait_until_ready(self.port, self.process, timeout=timeout)
+        if waited is not None:
+            self.startup_seconds = round(time.perf_counter() - self.started_at, 3)
+            self.ready = True
+        return waited is not None
+
+    def stop(self, force=False):
+        self.ready = False
+        if self.process and self.process.poll() is None:
+            if force:  # A hung server may never act on SIGTERM
+                self.process.kill()
+                self.process.wait()
+                return
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+
+class ProcessSupervisor:
+    """Run `workers` copies of a server command, restarting them when they exit or hang
+
+    With one worker the server binds the public port directly. With more, the
+    servers take the ports after it and a small TCP proxy on the public port
+    round-robins connections over whichever servers are ready. Each server is
+    watched by its own thread, so one slow restart never delays noticing another.
+    """
+
+    def __init__(self, command=("npm", "start"), cwd=".", port=3000, workers=None, host="0.0.0.0",
+                 env=None, ready_timeout=READY_TIMEOUT, on_change=None):
+        self.command = list(command)
+        self.cwd = cwd
+        self.port = port
+        self.host = host
+        workers = workers or int(os.environ.get("CLAUDE_FAST_WORKERS", 0)) or min(available_cpus(), MAX_WORKERS)
+        self.workers = max(1, workers)
+        self.env = dict(env or os.environ)
+        self.ready_timeout = ready_timeout
+        self.on_change = on_change
+        base_port = port if self.workers == 1 else port + 1
+        self.servers = [ServerProcess(i, base_port + i, self.command, cwd, self.env) for i in range(self.workers)]
+        self._round_robin = itertools.cycle(self.servers)
+        self._stopped = threading.Event()
+        self._proxy = None
+        atexit.register(self.stop)
+
+    @property
+    def startup_seconds(self):
+        return [server.startup_seconds for server in self.servers]
+
+    @property
+    def restarts(self):
+        return sum(server.restarts for server in self.servers)
+
+    def start(self):
+        """Start every server and the proxy, blocking until the public port answers HTTP"""
+        started = time.perf_counter()
+        print(f"🚀 Starting {self.workers} server process(es) behind port {self.port}...")
+        if self.workers > 1:
+            # Bind here so a busy port fails start() instead of a background thread
+            loop = asyncio.new_event_loop()
+            proxy = loop.run_until_complete(asyncio.start_server(self._proxy_connection, self.host, self.port))
+            self._proxy = (loop, proxy)
+            threading.Thread(target=loop.run_forever, daemon=True).start()
+        for server in self.servers:
+            threading.Thread(target=self._watch, args=(server,), daemon=True).start()
+
+        for server in self.servers:
+            server.settled.wait()
+        not_ready = [server.port for server in self.servers if not server.ready]
+        if not not_ready and wait_until_ready(self.port, timeout=self.ready_timeout) is None:
+            not_ready = [self.port]
+        if not_ready:
+            self.stop()
+            raise RuntimeError(f"Server(s) on port(s) {not_ready} not ready within {self.ready_timeout:.0f}s")
+        elapsed = time.perf_counter() - started
+        print(f"✅ All servers ready in {elapsed:.2f}s (per server: {self.startup_seconds})")
+        self._notify()
+        return elapsed
+
+    def supervise(self):
+        """Block until stop(); the per-server threads do the restarting"""
+        self._stopped.wait()
+
+    def stop(self):
+        self._stopped.set()
+        if self._proxy:
+            loop, proxy = self._proxy
+            loop.call_soon_threadsafe(proxy.close)
+            self._proxy = None
+        for server in self.servers:
+            server.stop()
+
+    def _watch(self, server):
+        """Start a server, health-poll it while it runs, and restart it with backoff when it exits or hangs"""
+        while not self._stopped.is_set():
+            server.start()
+            if server.wait_ready(self.ready_timeout):
+                if server.restarts:
+                    print(f"✅ Server on port {server.port} ready again in {server.startup_seconds:.2f}s")
+                server.settled.set()
+                self._notify()
+                reason = self._monitor(server)
+            else:
+                reason = f"was not ready within {self.ready_timeout:.0f}s"
+                server.settled.set()
+            if self._stopped.is_set():
+                return
+
+            uptime = time.perf_counter() - server.started_at
+            server.stop(force=True)
+            server.failures = 1 if uptime > STABLE_AFTER else server.failures + 1
+            delay = min(BACKOFF_MAX, BACKOFF_INITIAL * 2 ** (server.failures - 1))
+            print(f"💥 Server on port {server.port} {reason} after {uptime:.1f}s, restarting in {delay:.0f}s")
+            self._notify()
+            if self._stopped.wait(delay):
+                return
+            server.restarts += 1
+
+    def _monitor(self, server):
+        """Probe a running server until it exits or stays unresponsive; returns why it needs a restart"""
+        misses = 0
+        last_ok = time.perf_counter()
+        while not self._stopped.wait(HEALTH_INTERVAL):
+            if server.process.poll() is not None:
+                return f"exited with code {server.process.returncode}"
+            if probe(server.port):
+                misses, last_ok = 0, time.perf_counter()
+                if not server.ready:
+                    print(f"✅ Server on port {server.port} is answering again")
+                    server.ready = True
+                    self._notify()
+                continue
+            misses += 1
+            if misses == UNHEALTHY_AFTER:
+                print(f"⚠️  Server on port {server.port} missed {misses} health checks, taking it out of rotation")
+                server.ready = False
+                self._notify()
+            if time.perf_counter() - last_ok > self.ready_timeout:
+                return f"stopped answering for {self.ready_timeout:.0f}s"
+        return "was stopped"
+
+    def _notify(self):
+        if self.on_change:
+            self.on_change(self)
+
+    def _next_server(self):
+        for _ in range(len(self.servers)):
+            server = next(self._round_robin)
+            if server.ready:
+                return server
+        return None
+
+    async def _connect_upstream(self):
+        """Open a connection to the next ready server, skipping any that refuse it"""
+        for _ in range(len(self.servers)):
+            backend = self._next_server()
+            if backend is None:
+                return None
+            try:
+                return await asyncio.open_connection("127.0.0.1", backend.port)
+            except OSError:
+                # A server that just crashed stays ready until its next probe; _monitor restores it once it answers
+                backend.ready = False
+        return None
+
+    async def _proxy_connection(self, client_reader, client_writer):
+        upstream = await self._connect_upstream()
+        if upstream is None:
+            client_writer.close()
+            return
+        upstream_reader, upstream_writer = upstream
+        await asyncio.gather(self._pipe(client_reader, upstream_writer),
+                             self._pipe(upstream_reader, client_writer))
+        upstream_writer.close()
+        client_writer.close()
+
+    @staticmethod
+    async def _pipe(reader, writer):
+        try:
+            while True:
+                data = await reader.read(PROXY_CHUNK_SIZE)
+                if not data:
+                    break
+                writer.write(data)
+                await writer.drain()
+            if writer.can_write_eof():
+                writer.write_eof()  # Half-close so the other direction can finish its response
+        except (ConnectionError, OSError):
+            pass